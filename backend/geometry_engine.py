@@ -103,22 +103,31 @@ def apply_geometry(svg: str, rules: List[Dict[str, Any]]) -> str:
     - Returns the input SVG unchanged.
     - Does not perform any actual geometry transformation.
     - Exists to keep the backend stable and allow end-to-end testing.
-    - Does not currently raise GeometryEngineError.
+    - Raises GeometryEngineError only if `svg` is empty, whitespace-only or
+      not a string.
 
     Future Behavior (Target)
     ------------------------
-    - Parse SVG (e.g., via xml.etree.ElementTree).
+    - Return the input SVG without parsing when there are no rules or every
+      rule has value_cm == 0, skipping the parse/serialize round-trip.
+    - Parse SVG via lxml.etree (libxml2-backed) using the module-level
+      parser, so parsing and serialization stay in C.
     - Dispatch to specific transformation functions per operation.
     - Modify coordinates of paths/groups deterministically.
     - Preserve SVG validity and structure.
     - Raise GeometryEngineError if a transformation cannot be applied safely.
     """
+    # str.isspace() stops at the first non-whitespace character and, unlike
+    # svg.strip(), does not copy the whole document just to test emptiness.
+    if not isinstance(svg, str) or not svg or svg.isspace():
+        raise GeometryEngineError("svg must be a non-empty string")
+
     # ------------------------------------------------------------------------
     # PLACEHOLDER IMPLEMENTATION
     # ------------------------------------------------------------------------
     # In the final implementation, you would:
     #
-    #   1. Parse the SVG string into an XML tree.
+    #   1. Parse the SVG string into an XML tree with lxml.
     #   2. Loop over each rule in `rules`.
     #   3. For each rule, look up a handler in OPERATION_HANDLERS and apply it.
     #   4. Serialize the XML tree back to a string and return it.
@@ -126,16 +135,26 @@ def apply_geometry(svg: str, rules: List[Dict[str, Any]]) -> str:
     # For now, we simply return the SVG unchanged to keep the system stable.
     # ------------------------------------------------------------------------
 
-    # Example of what the real loop might look like:
+    # Example of what the real loop might look like. The parser should be a
+    # module-level singleton so libxml2's name dictionary is reused across
+    # requests instead of being rebuilt per call:
+    #
+    #   from lxml import etree
+    #
+    #   _SVG_PARSER = etree.XMLParser(remove_blank_text=False, huge_tree=False)
+    #
+    #   # No rule changes any coordinate -> skip the parse/serialize round-trip.
+    #   if not rules or all(rule.get("value_cm", 0) == 0 for rule in rules):
+    #       return svg
     #
-    #   tree = ElementTree.fromstring(svg)
+    #   tree = etree.fromstring(svg.encode("utf-8"), _SVG_PARSER)
     #   for rule in rules:
     #       op = rule["operation"]
     #       val = rule["value_cm"]
     #       handler = OPERATION_HANDLERS.get(op)
     #       if handler is not None:
     #           handler(tree, val)
-    #   return ElementTree.tostring(tree, encoding="unicode")
+    #   return etree.tostring(tree, encoding="unicode")
     #
     # But all of that is intentionally deferred for the MVP scaffold phase.
 
@@ -32,10 +32,15 @@ Expected Function Signature:
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import functools
 import json
 import re
+import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 
 class InterpretationError(Exception):
@@ -53,6 +58,10 @@ class InterpretationError(Exception):
 # Configuration Loading
 # ---------------------------------------------------------------------------
 
+# Computed once at import rather than on every config mtime check,
+# since Path.resolve() has to hit the filesystem.
+_CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "prompt_mapping.json"
+
 
 def _get_config_path() -> Path:
     """
@@ -65,9 +74,54 @@ def _get_config_path() -> Path:
         /config
             prompt_mapping.json
     """
-    backend_dir = Path(__file__).resolve().parent
-    project_root = backend_dir.parent
-    return project_root / "config" / "prompt_mapping.json"
+    return _CONFIG_PATH
+
+
+# (operation name, normalized synonym phrases) pairs in mapping order.
+_OperationMatchers = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+# (phrase, value) pairs of the numeric intensity keywords, longest phrase
+# first so that e.g. "very oversized" wins over "oversized".
+_IntensityKeywords = Tuple[Tuple[str, float], ...]
+
+_CompiledMapping = Tuple[_OperationMatchers, _IntensityKeywords]
+
+# (matched operation names, shared value_cm) for one normalized prompt.
+_Interpretation = Tuple[Tuple[str, ...], float]
+
+# Number of distinct normalized prompts memoized for the default mapping.
+_INTERPRETATION_CACHE_SIZE = 1024
+
+# Longest normalized prompt that is memoized. Prompts come straight from the
+# request body, so longer ones are interpreted without caching; otherwise the
+# cache could pin up to _INTERPRETATION_CACHE_SIZE arbitrarily large strings.
+_MAX_MEMOIZED_PROMPT_LENGTH = 256
+
+
+class _MappingCache(NamedTuple):
+    """
+    The default mapping as loaded from config/prompt_mapping.json, plus what
+    is derived from it. All fields are replaced together when the file's
+    mtime changes.
+    """
+
+    mtime_ns: int
+    mapping: Dict[str, Any]
+    compiled: _CompiledMapping
+    # _interpret_text bound to `compiled` and memoized per normalized prompt.
+    interpret: Callable[[str], _Interpretation]
+
+
+# Parsed default mapping keyed on the config file's mtime, so the JSON is only
+# read and parsed again when the file changes on disk. None while the file is
+# missing or invalid.
+_mapping_cache: Optional[_MappingCache] = None
+
+# Seconds between checks of the config file's mtime. Until the next check is
+# due (time.monotonic() >= _mapping_recheck_at), the cached result is used
+# without touching the filesystem, including when the last load failed.
+_MAPPING_CHECK_INTERVAL = 1.0
+_mapping_recheck_at = float("-inf")
 
 
 def load_prompt_mapping() -> Dict[str, Any]:
@@ -82,16 +136,107 @@ def load_prompt_mapping() -> Dict[str, Any]:
     If the file does not exist or is invalid, returns an empty mapping so that
     the rest of the system can still run. However, interpret_prompt will raise
     InterpretationError if it cannot use the mapping to produce valid rules.
+
+    The file is parsed once and cached until its mtime changes. Each call
+    returns a fresh deep copy of the cached mapping, so callers may modify it
+    without affecting interpretation with the default mapping.
     """
-    path = _get_config_path()
-    if not path.exists():
+    cached = _get_mapping_cache()
+    if cached is None:
         return {}
+    return copy.deepcopy(cached.mapping)
+
 
+def _get_mapping_cache() -> Optional[_MappingCache]:
+    """
+    Return the cached default mapping, loading it first if the config file
+    changed (or was never loaded). Returns None if the file does not exist or
+    is invalid.
+
+    The file's mtime is checked at most once per _MAPPING_CHECK_INTERVAL
+    seconds; in between, the last result is returned as-is.
+
+    The returned mapping is shared and must not be modified or handed to
+    callers outside this module; load_prompt_mapping() returns copies.
+    """
+    global _mapping_cache, _mapping_recheck_at
+
+    now = time.monotonic()
+    if now < _mapping_recheck_at:
+        return _mapping_cache
+    _mapping_recheck_at = now + _MAPPING_CHECK_INTERVAL
+
+    path = _get_config_path()
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        _mapping_cache = None
+        return None
+
+    cached = _mapping_cache
+    if cached is not None and cached.mtime_ns == mtime_ns:
+        return cached
+
+    try:
+        mapping = json.loads(path.read_bytes())
+        compiled = _compile_mapping(mapping)
     except Exception:
-        return {}
+        _mapping_cache = None
+        return None
+
+    cached = _MappingCache(
+        mtime_ns=mtime_ns,
+        mapping=mapping,
+        compiled=compiled,
+        interpret=_memoize_interpretation(compiled),
+    )
+    _mapping_cache = cached
+    return cached
+
+
+def _compile_mapping(mapping: Dict[str, Any]) -> _CompiledMapping:
+    """
+    Precompute the lookup structures interpret_prompt matches against:
+
+    - every operation's synonym phrases, normalized once like the prompt, so
+      matching does not re-lowercase the whole synonym list on each call.
+      Operations whose "synonyms" entry is not a list are skipped.
+      Operation names are interned, so the rules engine's allow-list and the
+      geometry engine's handler table compare them by identity.
+    - the intensity keywords with numeric values, sorted by descending
+      phrase length. Keywords with non-numeric values are skipped.
+    """
+    operations = []
+    for op_name, op_cfg in mapping.get("operations", {}).items():
+        synonyms = op_cfg.get("synonyms", [])
+        if not isinstance(synonyms, list):
+            continue
+        operations.append(
+            (sys.intern(op_name), tuple(_normalize_prompt(phrase) for phrase in synonyms))
+        )
+
+    intensity = []
+    for phrase, value in (mapping.get("intensity_keywords", {}) or {}).items():
+        try:
+            intensity.append((_normalize_prompt(phrase), float(value)))
+        except (TypeError, ValueError):
+            continue
+    intensity.sort(key=lambda item: len(item[0]), reverse=True)
+
+    return tuple(operations), tuple(intensity)
+
+
+def _memoize_interpretation(compiled: _CompiledMapping) -> Callable[[str], _Interpretation]:
+    """
+    Return _interpret_text bound to `compiled`, memoized per normalized
+    prompt. Callers only pass prompts up to _MAX_MEMOIZED_PROMPT_LENGTH.
+    """
+
+    @functools.lru_cache(maxsize=_INTERPRETATION_CACHE_SIZE)
+    def interpret(text: str) -> _Interpretation:
+        return _interpret_text(text, compiled)
+
+    return interpret
 
 
 # ---------------------------------------------------------------------------
@@ -99,6 +244,30 @@ def load_prompt_mapping() -> Dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
+# Punctuation that never carries meaning for phrase matching. "." is kept so
+# decimal values such as "2.5 cm" survive normalization.
+_NORMALIZE_TRANS = str.maketrans({c: " " for c in ",;:!?\"'()[]"})
+
+
+def _normalize_prompt(prompt: str) -> str:
+    """
+    Return the normalized text that all matching runs against: lowercased,
+    with punctuation replaced by spaces and whitespace runs collapsed.
+
+    Example:
+        "Crop the hem,  then (slightly) widen!" -> "crop the hem then slightly widen"
+
+    Prompts that are already lowercase skip the copy that str.lower() would
+    allocate.
+    """
+    lower = prompt if prompt.islower() else prompt.lower()
+    return " ".join(lower.translate(_NORMALIZE_TRANS).split())
+
+
+# First "<number> cm" occurrence, e.g. "3 cm" or "2.5cm".
+_CM_RE = re.compile(r"(\d+(?:\.\d+)?)\s*cm")
+
+
 def _extract_numeric_cm(text: str) -> Optional[float]:
     """
     Extract the first numeric value followed by 'cm' in the text, if any.
@@ -106,28 +275,25 @@ def _extract_numeric_cm(text: str) -> Optional[float]:
     Example:
         "shorten the shirt by 3 cm" -> 3.0
     """
-    match = re.search(r"(\d+(?:\.\d+)?)\s*cm", text)
+    match = _CM_RE.search(text)
     if not match:
         return None
     return float(match.group(1))
 
 
-def _detect_intensity(text: str, intensity_map: Dict[str, Any]) -> Optional[float]:
+def _detect_intensity(text: str, intensity_keywords: _IntensityKeywords) -> Optional[float]:
     """
     Detect an intensity keyword (e.g., 'a bit') and return its numeric value,
-    if any.
+    if any. When several keywords match, the longest one wins.
 
     Note:
     - This is allowed because it still results in a numeric value_cm.
     - Style/fit interpretation such as "boxy", "oversized", etc. is out of MVP
       scope and must not be inferred here.
     """
-    for phrase, value in intensity_map.items():
+    for phrase, value in intensity_keywords:
         if phrase in text:
-            try:
-                return float(value)
-            except (TypeError, ValueError):
-                continue
+            return value
     return None
 
 
@@ -136,6 +302,49 @@ def _detect_intensity(text: str, intensity_map: Dict[str, Any]) -> Optional[floa
 # ---------------------------------------------------------------------------
 
 
+def _interpret_text(text: str, compiled: _CompiledMapping) -> _Interpretation:
+    """
+    Match a normalized prompt against a compiled mapping.
+
+    Returns the matched operation names (in mapping order) and the value_cm
+    shared by all of them. Raises InterpretationError as described in
+    interpret_prompt. This is a pure function of its arguments, which is
+    what allows _memoize_interpretation() to cache it.
+    """
+    operation_matchers, intensity_keywords = compiled
+
+    # ------------------------------------------------------------------------
+    # 1. Operation synonyms
+    #
+    # Operation names come from the mapping's "operations" keys, so each one
+    # is visited exactly once and no duplicate rules can be produced.
+    # ------------------------------------------------------------------------
+    matched_operations = tuple(
+        op_name
+        for op_name, phrases in operation_matchers
+        # If any synonym phrase appears in the prompt, consider it a match.
+        if any(phrase in text for phrase in phrases)
+    )
+
+    if not matched_operations:
+        # No operations detected from the prompt → unsupported instruction.
+        raise InterpretationError("No supported operations could be inferred from prompt.")
+
+    # ------------------------------------------------------------------------
+    # 2. Determine numeric value, shared by all matched operations:
+    #   1. Explicit "X cm" in text
+    #   2. Intensity keyword (e.g., "a bit")
+    # ------------------------------------------------------------------------
+    value_cm = _extract_numeric_cm(text)
+    if value_cm is None:
+        value_cm = _detect_intensity(text, intensity_keywords)
+    if value_cm is None:
+        # For MVP, we do not invent arbitrary values without numeric basis.
+        raise InterpretationError("Missing numeric value for operation.")
+
+    return matched_operations, value_cm
+
+
 def interpret_prompt(prompt: str, mapping: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """
     Convert a natural-language prompt into a list of rule dictionaries.
@@ -155,6 +364,11 @@ def interpret_prompt(prompt: str, mapping: Optional[Dict[str, Any]] = None) -> L
     mapping : dict, optional
         Mapping loaded from config/prompt_mapping.json. If not provided, this
         function will load it automatically.
+        Without an explicit mapping, results are memoized per normalized
+        prompt (lowercased, punctuation stripped, whitespace collapsed), so
+        identical prompts are interpreted once. Failures and prompts longer
+        than _MAX_MEMOIZED_PROMPT_LENGTH characters are not memoized. An
+        explicit mapping is compiled on every call.
 
     Returns
     -------
@@ -170,8 +384,10 @@ def interpret_prompt(prompt: str, mapping: Optional[Dict[str, Any]] = None) -> L
       appropriate API error code ("unsupported_instruction" or
       "invalid_rule_format").
     """
+    cached: Optional[_MappingCache] = None
     if mapping is None:
-        mapping = load_prompt_mapping()
+        cached = _get_mapping_cache()
+        mapping = cached.mapping if cached is not None else {}
 
     if not mapping:
         raise InterpretationError("No prompt mapping configuration available.")
@@ -180,59 +396,44 @@ def interpret_prompt(prompt: str, mapping: Optional[Dict[str, Any]] = None) -> L
     if not operations_cfg:
         raise InterpretationError("No operations defined in prompt mapping configuration.")
 
-    intensity_map = mapping.get("intensity_keywords", {}) or {}
-
-    lower = prompt.lower()
-    rules: List[Dict[str, Any]] = []
-    seen_operations: set[str] = set()
+    text = _normalize_prompt(prompt)
+
+    if cached is None:
+        operations, value_cm = _interpret_text(text, _compile_mapping(mapping))
+    elif len(text) <= _MAX_MEMOIZED_PROMPT_LENGTH:
+        # Default mapping: results are memoized per normalized prompt, so
+        # repeated short prompts skip matching entirely.
+        operations, value_cm = cached.interpret(text)
+    else:
+        operations, value_cm = _interpret_text(text, cached.compiled)
+
+    # Fresh dicts on every call, so callers cannot mutate memoized results.
+    rules: List[Dict[str, Any]] = [
+        {
+            "operation": op_name,
+            "value_cm": value_cm,
+        }
+        for op_name in operations
+    ]
 
-    # ------------------------------------------------------------------------
-    # 1. Determine numeric value from explicit cm or intensity.
-    # ------------------------------------------------------------------------
-    explicit_value = _extract_numeric_cm(lower)
-    intensity_value = _detect_intensity(lower, intensity_map)
-
-    # ------------------------------------------------------------------------
-    # 2. Operation synonyms + numeric handling
-    # ------------------------------------------------------------------------
-    for op_name, op_cfg in operations_cfg.items():
-        synonyms = op_cfg.get("synonyms", [])
-        if not isinstance(synonyms, list):
-            continue
-
-        # If any synonym phrase appears in the prompt, consider it a match.
-        matched = any(phrase.lower() in lower for phrase in synonyms)
-        if not matched:
-            continue
-
-        if op_name in seen_operations:
-            # Do not add duplicate operations.
-            continue
-
-        # Determine value_cm priority:
-        # 1. Explicit "X cm" in text
-        # 2. Intensity keyword (e.g., "a bit")
-        if explicit_value is not None:
-            value_cm = explicit_value
-        elif intensity_value is not None:
-            value_cm = intensity_value
-        else:
-            # For MVP, we do not invent arbitrary values without numeric basis.
-            raise InterpretationError("Missing numeric value for operation.")
-
-        rules.append(
-            {
-                "operation": op_name,
-                "value_cm": value_cm,
-            }
-        )
-        seen_operations.add(op_name)
+    return rules
 
-    # ------------------------------------------------------------------------
-    # 3. Ensure at least one valid rule exists
-    # ------------------------------------------------------------------------
-    if not rules:
-        # No operations detected from the prompt → unsupported instruction.
-        raise InterpretationError("No supported operations could be inferred from prompt.")
 
-    return rules
+async def interpret_prompt_async(prompt: str) -> List[Dict[str, Any]]:
+    """
+    Async variant of `interpret_prompt` (with the default mapping) for use
+    from `async def` routes.
+
+    Short prompts against an up-to-date cached mapping are interpreted
+    directly on the event loop. Everything that can block runs in a worker
+    thread via `asyncio.to_thread`: a due mtime check of the config file
+    (and the reload that may follow), and prompts longer than
+    _MAX_MEMOIZED_PROMPT_LENGTH characters, whose normalization is not
+    bounded. Returns the same rules and raises the same exceptions as
+    `interpret_prompt`.
+    """
+    if len(prompt) > _MAX_MEMOIZED_PROMPT_LENGTH:
+        return await asyncio.to_thread(interpret_prompt, prompt)
+    if time.monotonic() >= _mapping_recheck_at:
+        await asyncio.to_thread(_get_mapping_cache)
+    return interpret_prompt(prompt)
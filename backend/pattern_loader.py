@@ -25,13 +25,33 @@ and combine multiple pieces if needed.
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
+from typing import Dict, Tuple
+
+
+class PatternNotFoundError(FileNotFoundError):
+    """
+    Raised when the SVG for a requested pattern family/piece does not exist.
+
+    Subclasses FileNotFoundError, so existing `except FileNotFoundError`
+    handlers keep working. The router/server must catch this and return:
+        {
+            "error": "invalid_pattern_id",
+            "details": {}
+        }
+    using the unified error format.
+    """
 
 
 # ---------------------------------------------------------------------------
 # Internal Helpers
 # ---------------------------------------------------------------------------
 
+# Resolved once at import: Path.resolve() canonicalizes via filesystem
+# syscalls, and the location of this file does not change at runtime.
+_PATTERN_ROOT = Path(__file__).resolve().parent.parent / "pattern"
+
 
 def _get_pattern_root() -> Path:
     """
@@ -55,23 +75,35 @@ def _get_pattern_root() -> Path:
                 back.svg
                 sleeve.svg
     """
-    backend_dir = Path(__file__).resolve().parent
-    project_root = backend_dir.parent
-    return project_root / "pattern"
+    return _PATTERN_ROOT
 
 
 def _load_svg_file(path: Path) -> str:
     """
     Load a single SVG file as a string.
 
-    Raises FileNotFoundError if the file does not exist.
+    Raises PatternNotFoundError if the file does not exist.
     """
     if not path.exists():
-        raise FileNotFoundError(f"SVG file not found: {path}")
+        raise PatternNotFoundError(f"SVG file not found: {path}")
 
     return path.read_text(encoding="utf-8")
 
 
+def _get_svg_path(pattern_id: str, piece: str) -> Path:
+    """
+    Return the path of one pattern piece: /pattern/{pattern_id}/{piece}.svg
+    """
+    return _get_pattern_root() / pattern_id / f"{piece}.svg"
+
+
+# Loaded SVG text keyed on (pattern_id, piece), shared by the sync and async
+# loaders. Pattern assets are static, so each file is read from disk once per
+# process. Missing files raise before anything is stored, so only files that
+# exist on disk ever occupy an entry.
+_SVG_CACHE: Dict[Tuple[str, str], str] = {}
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -103,7 +135,7 @@ def load_pattern_svg(pattern_id: str, piece: str = "front") -> str:
 
     Raises
     ------
-    FileNotFoundError
+    PatternNotFoundError
         If the requested SVG file does not exist.
 
     Notes
@@ -112,10 +144,45 @@ def load_pattern_svg(pattern_id: str, piece: str = "front") -> str:
       relying on the default piece="front".
     - The geometry engine can optionally use `piece` to load all three
       components if needed in future versions.
+    - Results are cached per (pattern_id, piece), so each SVG is read from
+      disk once per process. Pattern assets are static; call
+      `clear_pattern_cache()` after replacing files on disk.
+      Missing files are not cached.
+    """
+    key = (pattern_id, piece)
+    try:
+        return _SVG_CACHE[key]
+    except KeyError:
+        pass
+
+    svg = _load_svg_file(_get_svg_path(pattern_id, piece))
+    _SVG_CACHE[key] = svg
+    return svg
+
+
+async def load_pattern_svg_async(pattern_id: str, piece: str = "front") -> str:
     """
-    pattern_root = _get_pattern_root()
+    Async variant of `load_pattern_svg` for use from `async def` routes.
+
+    Cache hits are returned directly on the event loop. Only a miss reads
+    the file, in a worker thread via `asyncio.to_thread`, so disk I/O does
+    not block the loop. Accepts the same parameters, returns the same
+    string, and raises the same exceptions as `load_pattern_svg`, sharing
+    its cache.
+    """
+    key = (pattern_id, piece)
+    try:
+        return _SVG_CACHE[key]
+    except KeyError:
+        pass
+
+    svg = await asyncio.to_thread(_load_svg_file, _get_svg_path(pattern_id, piece))
+    _SVG_CACHE[key] = svg
+    return svg
 
-    # Construct path: /pattern/{pattern_id}/{piece}.svg
-    svg_path = pattern_root / pattern_id / f"{piece}.svg"
 
-    return _load_svg_file(svg_path)
+def clear_pattern_cache() -> None:
+    """
+    Drop all cached SVGs, so the next load reads them from disk again.
+    """
+    _SVG_CACHE.clear()
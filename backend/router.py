@@ -1,8 +1,3 @@
-Here’s the **fixed `router.py`** aligned with your current MVP spec, `interpretation.py`, `rules_engine.py`, `geometry_engine.py`, and `api_contract.md`.
-
-You can paste this **directly** over the existing file.
-
-```python
 """
 router.py
 
@@ -34,6 +29,7 @@ Implementation Status:
 # Example FastAPI router structure (commented out, not active yet):
 
 # from fastapi import APIRouter, HTTPException
+# from fastapi.responses import Response
 # from typing import Any, Dict
 #
 # from .interpretation import interpret_prompt, InterpretationError
@@ -127,7 +123,7 @@ Implementation Status:
 #
 #
 # @router.get("/patterns/{pattern_id}")
-# async def get_pattern(pattern_id: str) -> str:
+# async def get_pattern(pattern_id: str) -> Response:
 #     """
 #     Placeholder route:
 #     - Returns the base SVG for a given pattern_id.
@@ -146,7 +142,8 @@ Implementation Status:
 #             detail={"error": "internal_error", "details": {}},
 #         )
 #
-#     return svg
+#     # Raw SVG body, not a JSON-encoded (and escaped) string.
+#     return Response(content=svg, media_type="image/svg+xml")
 #
 #
 # def register_routes(app):
@@ -155,4 +152,3 @@ Implementation Status:
 #     Intended to be called from server.py once the backend is implemented.
 #     """
 #     app.include_router(router)
-```
@@ -34,7 +34,9 @@ This file must stay in sync with:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import sys
+from operator import itemgetter
+from typing import Any, Dict, Final, FrozenSet, List
 
 
 class RuleValidationError(Exception):
@@ -54,7 +56,7 @@ class RuleValidationError(Exception):
 # These operation names must match:
 # - mvp_spec.md section "In-Scope Adjustments"
 # - config/prompt_mapping.json → "operations" keys
-ALLOWED_OPERATIONS = {
+ALLOWED_OPERATIONS: Final[FrozenSet[str]] = frozenset({
     # Body adjustments
     "crop_hem",
     "extend_hem",
@@ -70,13 +72,17 @@ ALLOWED_OPERATIONS = {
     # Neckline adjustments
     "raise_neckline",
     "lower_neckline",
-}
+})
 
 
 # ---------------------------------------------------------------------------
 # Validation Helpers
 # ---------------------------------------------------------------------------
 
+# Fetches both required fields of a rule dict in one call. Raises KeyError
+# naming the first missing field, checked in this order.
+_get_rule_fields = itemgetter("operation", "value_cm")
+
 
 def _validate_operation(name: Any) -> str:
     """
@@ -90,7 +96,8 @@ def _validate_operation(name: Any) -> str:
     Returns
     -------
     str
-        The normalized operation string.
+        The normalized operation string, interned so it is the same object
+        as the matching entry in ALLOWED_OPERATIONS.
 
     Raises
     ------
@@ -107,7 +114,7 @@ def _validate_operation(name: Any) -> str:
     if op not in ALLOWED_OPERATIONS:
         raise RuleValidationError(f"unsupported operation: {op}")
 
-    return op
+    return sys.intern(op)
 
 
 def _validate_value_cm(value: Any) -> float:
@@ -129,6 +136,15 @@ def _validate_value_cm(value: Any) -> float:
     RuleValidationError
         If value is missing or not numeric.
     """
+    # Fast path: JSON numbers arrive as exact int/float, so skip float()'s
+    # generic conversion and the exception handler setup. `type() is` keeps
+    # bool (an int subclass) on the generic path.
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+
     if value is None:
         raise RuleValidationError("value_cm is required")
 
@@ -189,7 +205,8 @@ def validate_rules(rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     if not isinstance(rules, list):
         raise RuleValidationError("rules must be a list")
 
-    if len(rules) == 0:
+    rule_count = len(rules)
+    if rule_count == 0:
         raise RuleValidationError("rules list cannot be empty")
 
     normalized_rules: List[Dict[str, Any]] = []
@@ -198,14 +215,15 @@ def validate_rules(rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         if not isinstance(raw_rule, dict):
             raise RuleValidationError(f"rule at index {idx} must be a dict")
 
-        if "operation" not in raw_rule:
-            raise RuleValidationError(f"rule at index {idx} missing 'operation' field")
-
-        if "value_cm" not in raw_rule:
-            raise RuleValidationError(f"rule at index {idx} missing 'value_cm' field")
+        try:
+            raw_op, raw_value = _get_rule_fields(raw_rule)
+        except KeyError as exc:
+            raise RuleValidationError(
+                f"rule at index {idx} missing '{exc.args[0]}' field"
+            ) from None
 
-        op = _validate_operation(raw_rule.get("operation"))
-        val = _validate_value_cm(raw_rule.get("value_cm"))
+        op = _validate_operation(raw_op)
+        val = _validate_value_cm(raw_value)
 
         normalized_rules.append(
             {
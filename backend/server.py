@@ -24,27 +24,44 @@ Implementation Status:
 
 from typing import List, Dict, Any
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from pydantic import BaseModel, Field
 
 # These modules are expected to be implemented separately.
 # For now, they can be stubbed or left unimplemented.
 try:
-    from interpretation import interpret_prompt  # type: ignore
+    from interpretation import interpret_prompt_async  # type: ignore
     from rules_engine import validate_rules, RuleValidationError  # type: ignore
     from geometry_engine import apply_geometry  # type: ignore
-    from pattern_loader import load_pattern_svg  # type: ignore
+    from pattern_loader import load_pattern_svg_async, PatternNotFoundError  # type: ignore
     from interpretation import InterpretationError  # type: ignore
 except ImportError:
     # During early scaffold phase, these may not exist yet.
-    interpret_prompt = None
+    interpret_prompt_async = None
     validate_rules = None
     apply_geometry = None
-    load_pattern_svg = None
+    load_pattern_svg_async = None
     InterpretationError = Exception  # type: ignore
     RuleValidationError = Exception  # type: ignore
+    PatternNotFoundError = Exception  # type: ignore
+
+# Scaffold mode (placeholder responses) is decided once at import; the set of
+# available modules cannot change afterwards.
+SCAFFOLD_MODE = any(
+    module is None
+    for module in (
+        interpret_prompt_async,
+        validate_rules,
+        apply_geometry,
+        load_pattern_svg_async,
+    )
+)
 
 
+# JSON bodies are rendered from each route's response_model, which FastAPI
+# serializes with Pydantic's compiled serializer. No custom response class is
+# set: ORJSONResponse is deprecated in current FastAPI (0.143+) and would add
+# an undeclared orjson dependency.
 app = FastAPI(
     title="CUTMIND MVP API",
     version="0.1.0",
@@ -99,13 +116,16 @@ def error_response(message: str, details: Dict[str, Any] | None = None) -> Dict[
     }
 
 
+# Supported MVP block families (see mvp_spec.md section 2).
+VALID_PATTERN_IDS = frozenset({"tshirt", "long_sleeve", "crop_top"})
+
+
 def validate_pattern_id(pattern_id: str) -> None:
     """
     Ensure pattern_id is one of the supported MVP blocks.
     Raises HTTPException on invalid ID.
     """
-    valid_ids = {"tshirt", "long_sleeve", "crop_top"}
-    if pattern_id not in valid_ids:
+    if pattern_id not in VALID_PATTERN_IDS:
         raise HTTPException(
             status_code=400,
             detail=error_response("invalid_pattern_id", {"pattern_id": pattern_id}),
@@ -122,7 +142,7 @@ def validate_pattern_id(pattern_id: str) -> None:
     response_model=InterpretResponse,
     responses={400: {"model": ErrorResponse}},
 )
-def interpret(request: InterpretRequest):
+async def interpret(request: InterpretRequest):
     """
     Convert a natural-language prompt into structured rules.
 
@@ -130,7 +150,7 @@ def interpret(request: InterpretRequest):
     - Use interpretation.py / LLM to map prompt → rule JSON.
     - Validate rule structure before returning.
     """
-    if interpret_prompt is None:
+    if SCAFFOLD_MODE:
         # Placeholder behavior until interpretation.py is implemented.
         dummy_rules = [
             Rule(operation="crop_hem", value_cm=5.0),
@@ -139,9 +159,12 @@ def interpret(request: InterpretRequest):
         return InterpretResponse(rules=dummy_rules)
 
     try:
-        raw_rules = interpret_prompt(request.prompt)
-        rules = [Rule(**rule_dict) for rule_dict in raw_rules]
-        return InterpretResponse(rules=rules)
+        # Warm, short prompts are interpreted on the event loop; config reloads
+        # and long prompts run in a worker thread.
+        raw_rules = await interpret_prompt_async(request.prompt)
+        # The model validates the whole list of rule dicts in one call
+        # instead of constructing each Rule separately.
+        return InterpretResponse(rules=raw_rules)
     except InterpretationError as exc:
         # Prompt could not be mapped cleanly → unsupported or invalid
         raise HTTPException(
@@ -160,7 +183,7 @@ def interpret(request: InterpretRequest):
     response_model=ApplyRulesResponse,
     responses={400: {"model": ErrorResponse}},
 )
-def apply_rules(request: ApplyRulesRequest):
+async def apply_rules(request: ApplyRulesRequest):
     """
     Apply validated rules to a base pattern and return the modified SVG.
 
@@ -172,17 +195,22 @@ def apply_rules(request: ApplyRulesRequest):
     """
     validate_pattern_id(request.pattern_id)
 
-    if any(module is None for module in (validate_rules, load_pattern_svg, apply_geometry)):
+    if SCAFFOLD_MODE:
         # Placeholder behavior until individual modules are implemented.
         dummy_svg = "<svg><!-- placeholder modified pattern --></svg>"
         return ApplyRulesResponse(modified_pattern_svg=dummy_svg)
 
     try:
-        # Step 1: Validate rules
-        validated_rules = validate_rules([rule.dict() for rule in request.rules])
+        # Step 1: Validate rules. The Rule models are already typed, so their
+        # two fields are handed over directly rather than via .dict(), which
+        # walks the model's field definitions per rule.
+        validated_rules = validate_rules(
+            [{"operation": rule.operation, "value_cm": rule.value_cm} for rule in request.rules]
+        )
 
-        # Step 2: Load base SVG
-        base_svg = load_pattern_svg(request.pattern_id)
+        # Step 2: Load base SVG (cache hits return on the event loop; disk
+        # reads happen in a worker thread)
+        base_svg = await load_pattern_svg_async(request.pattern_id)
 
         # Step 3: Apply geometry transformations
         modified_svg = apply_geometry(base_svg, validated_rules)
@@ -193,6 +221,11 @@ def apply_rules(request: ApplyRulesRequest):
             status_code=400,
             detail=error_response("invalid_rule_format", {"exception": str(exc)}),
         ) from exc
+    except PatternNotFoundError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail=error_response("invalid_pattern_id", {"exception": str(exc)}),
+        ) from exc
     except HTTPException:
         # Re-raise any explicit HTTPException as-is
         raise
@@ -210,25 +243,36 @@ def apply_rules(request: ApplyRulesRequest):
         400: {"model": ErrorResponse},
     },
 )
-def get_pattern(pattern_id: str):
+async def get_pattern(pattern_id: str):
     """
     Return the raw base SVG pattern for the given pattern_id.
 
     - tshirt
     - long_sleeve
     - crop_top
+
+    The SVG is sent as the raw response body (image/svg+xml), not as a
+    JSON-encoded string, so it is neither escaped nor re-serialized.
     """
     validate_pattern_id(pattern_id)
 
-    if load_pattern_svg is None:
+    if SCAFFOLD_MODE:
         # Placeholder SVG until pattern_loader is implemented.
-        return "<svg><!-- placeholder base pattern --></svg>"
+        return Response(
+            content="<svg><!-- placeholder base pattern --></svg>",
+            media_type="image/svg+xml",
+        )
 
     try:
-        svg = load_pattern_svg(pattern_id)
-        return svg
-    except Exception as exc:  # noqa: BLE001
+        svg = await load_pattern_svg_async(pattern_id)
+        return Response(content=svg, media_type="image/svg+xml")
+    except PatternNotFoundError as exc:
         raise HTTPException(
             status_code=400,
             detail=error_response("invalid_pattern_id", {"exception": str(exc)}),
         ) from exc
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(
+            status_code=400,
+            detail=error_response("internal_error", {"exception": str(exc)}),
+        ) from exc
@@ -0,0 +1,176 @@
+"""
+Tests for the cached prompt mapping and memoized interpretation in
+interpretation.py.
+
+Each test points the module at its own temporary prompt_mapping.json and
+starts from an empty cache, so the real config file is never read.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import interpretation
+
+
+MAPPING = {
+    "operations": {
+        "crop_hem": {"synonyms": ["crop the hem"]},
+        "widen_sleeve": {"synonyms": ["widen the sleeves"]},
+    },
+    "intensity_keywords": {"a bit": 2},
+}
+
+
+class MappingCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.config_path = Path(tmp.name) / "prompt_mapping.json"
+        self.write_mapping(MAPPING)
+
+        saved_path = interpretation._CONFIG_PATH
+        saved_cache = interpretation._mapping_cache
+        saved_recheck_at = interpretation._mapping_recheck_at
+        interpretation._CONFIG_PATH = self.config_path
+        interpretation._mapping_cache = None
+        interpretation._mapping_recheck_at = float("-inf")
+
+        def restore():
+            interpretation._CONFIG_PATH = saved_path
+            interpretation._mapping_cache = saved_cache
+            interpretation._mapping_recheck_at = saved_recheck_at
+
+        self.addCleanup(restore)
+
+    def write_mapping(self, mapping, mtime_ns=None):
+        self.config_path.write_text(json.dumps(mapping), encoding="utf-8")
+        if mtime_ns is not None:
+            os.utime(self.config_path, ns=(mtime_ns, mtime_ns))
+
+    def memo_info(self):
+        return interpretation._mapping_cache.interpret.cache_info()
+
+    def test_short_prompt_with_default_mapping_is_memoized(self):
+        first = interpretation.interpret_prompt("Crop the hem 3 cm")
+        second = interpretation.interpret_prompt("crop the hem,  3 cm!")
+
+        expected = [{"operation": "crop_hem", "value_cm": 3.0}]
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected)
+        # Both prompts normalize to the same text, so the second is a hit.
+        self.assertEqual(self.memo_info().hits, 1)
+        self.assertEqual(self.memo_info().currsize, 1)
+        # Every call still gets its own rule dicts.
+        self.assertIsNot(first[0], second[0])
+
+    def test_long_prompt_is_not_memoized(self):
+        prompt = "crop the hem 3 cm " + "x " * interpretation._MAX_MEMOIZED_PROMPT_LENGTH
+
+        rules = interpretation.interpret_prompt(prompt)
+
+        self.assertEqual(rules, [{"operation": "crop_hem", "value_cm": 3.0}])
+        self.assertEqual(self.memo_info().currsize, 0)
+
+    def test_explicit_mapping_is_not_memoized(self):
+        interpretation.interpret_prompt("crop the hem 3 cm")
+        mapping = {"operations": {"crop_hem": {"synonyms": ["chop"]}}}
+
+        rules = interpretation.interpret_prompt("chop 4cm", mapping)
+
+        self.assertEqual(rules, [{"operation": "crop_hem", "value_cm": 4.0}])
+        self.assertEqual(self.memo_info().currsize, 1)
+
+    def test_loaded_mapping_is_a_copy(self):
+        mapping = interpretation.load_prompt_mapping()
+        mapping["operations"]["crop_hem"]["synonyms"] = ["chop"]
+
+        self.assertEqual(
+            interpretation.interpret_prompt("chop 3cm", mapping),
+            [{"operation": "crop_hem", "value_cm": 3.0}],
+        )
+        # The cached default mapping is unaffected by the caller's edit.
+        self.assertEqual(
+            interpretation.interpret_prompt("crop the hem 3cm"),
+            [{"operation": "crop_hem", "value_cm": 3.0}],
+        )
+        self.assertEqual(interpretation.load_prompt_mapping(), MAPPING)
+
+    def test_failures_are_not_memoized(self):
+        with self.assertRaises(interpretation.InterpretationError):
+            interpretation.interpret_prompt("widen the sleeves")
+
+        self.assertEqual(self.memo_info().currsize, 0)
+
+    def test_mtime_change_reloads_mapping_and_drops_memo(self):
+        stat = self.config_path.stat()
+        self.assertEqual(
+            interpretation.interpret_prompt("crop the hem a bit"),
+            [{"operation": "crop_hem", "value_cm": 2.0}],
+        )
+        old_cache = interpretation._mapping_cache
+
+        changed = {
+            "operations": {"crop_hem": {"synonyms": ["crop the hem"]}},
+            "intensity_keywords": {"a bit": 1},
+        }
+        self.write_mapping(changed, mtime_ns=stat.st_mtime_ns + 1_000_000_000)
+        # Make the next mtime check due instead of waiting for the interval.
+        interpretation._mapping_recheck_at = float("-inf")
+
+        self.assertEqual(
+            interpretation.interpret_prompt("crop the hem a bit"),
+            [{"operation": "crop_hem", "value_cm": 1.0}],
+        )
+        self.assertIsNot(interpretation._mapping_cache, old_cache)
+        self.assertEqual(self.memo_info().currsize, 1)
+
+    def test_mtime_is_not_checked_until_interval_elapses(self):
+        interpretation.interpret_prompt("crop the hem 3 cm")
+        cached = interpretation._mapping_cache
+
+        self.config_path.unlink()
+
+        self.assertEqual(
+            interpretation.interpret_prompt("crop the hem 3 cm"),
+            [{"operation": "crop_hem", "value_cm": 3.0}],
+        )
+        self.assertIs(interpretation._mapping_cache, cached)
+
+    def test_invalid_mapping_is_not_reread_until_interval_elapses(self):
+        self.config_path.write_text("{not json", encoding="utf-8")
+        self.assertEqual(interpretation.load_prompt_mapping(), {})
+
+        self.write_mapping(MAPPING)
+
+        self.assertEqual(interpretation.load_prompt_mapping(), {})
+        interpretation._mapping_recheck_at = float("-inf")
+        self.assertEqual(interpretation.load_prompt_mapping(), MAPPING)
+
+    def test_async_variant_matches_sync(self):
+        short = "crop the hem and widen the sleeves a bit"
+        long = short + " x" * interpretation._MAX_MEMOIZED_PROMPT_LENGTH
+
+        for prompt in (short, long):
+            self.assertEqual(
+                asyncio.run(interpretation.interpret_prompt_async(prompt)),
+                interpretation.interpret_prompt(prompt),
+            )
+        with self.assertRaises(interpretation.InterpretationError):
+            asyncio.run(interpretation.interpret_prompt_async("widen the sleeves"))
+
+    def test_unchanged_mtime_reuses_cache(self):
+        interpretation.load_prompt_mapping()
+        cached = interpretation._mapping_cache
+
+        interpretation._mapping_recheck_at = float("-inf")
+        interpretation.load_prompt_mapping()
+
+        self.assertIs(interpretation._mapping_cache, cached)
+
+
+if __name__ == "__main__":
+    unittest.main()